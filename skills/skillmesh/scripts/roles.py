@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import argparse
+import functools
 import os
 import shlex
 import shutil
@@ -10,21 +11,45 @@ import sys
 from pathlib import Path
 
 
+_REPO_ROOT_CACHE: dict[tuple[str, str], Path | None] = {}
+
+
 def _find_repo_root() -> Path | None:
-    markers = ("src/skill_registry_rag/__main__.py", "examples/registry/tools.json")
-    starts = [Path.cwd(), Path(__file__).resolve()]
-    for start in starts:
-        for candidate in [start, *start.parents]:
-            if all((candidate / marker).exists() for marker in markers):
-                return candidate
-    return None
+    cwd = os.getcwd()
+    here = os.path.realpath(__file__)
+    key = (cwd, here)
+    if key in _REPO_ROOT_CACHE:
+        return _REPO_ROOT_CACHE[key]
+
+    found: Path | None = None
+    for start in (cwd, here):
+        parent = start
+        while True:
+            # Check the catalog marker first; the package marker only matters on a hit.
+            if os.path.isfile(
+                os.path.join(parent, "examples", "registry", "tools.json")
+            ) and os.path.isfile(
+                os.path.join(parent, "src", "skill_registry_rag", "__main__.py")
+            ):
+                found = Path(parent)
+                break
+            new_parent = os.path.dirname(parent)
+            if new_parent == parent:
+                break
+            parent = new_parent
+        if found is not None:
+            break
+
+    _REPO_ROOT_CACHE[key] = found
+    return found
 
 
 def _existing_path(value: str) -> str:
-    p = Path(value).expanduser()
-    return str(p.resolve()) if p.exists() else ""
+    p = os.path.expanduser(value)
+    return str(Path(p).resolve()) if os.path.exists(p) else ""
 
 
+@functools.lru_cache(maxsize=1)
 def _default_catalog() -> str:
     env = os.getenv("SKILLMESH_CATALOG", "").strip()
     if env:
@@ -58,6 +83,24 @@ def _default_target_registry() -> str:
     return str((Path.home() / ".codex" / "skills" / "skillmesh" / "installed.registry.yaml"))
 
 
+def _load_cli_main():
+    """Return ``(cli_main, None)``, or ``(None, error)`` with the last ImportError."""
+    try:
+        from skill_registry_rag.cli import main as cli_main
+    except ImportError as exc:
+        repo_root = _find_repo_root()
+        if repo_root is None:
+            return None, exc
+        src_path = str(repo_root / "src")
+        if src_path not in sys.path:
+            sys.path.insert(0, src_path)
+        try:
+            from skill_registry_rag.cli import main as cli_main
+        except ImportError as exc:
+            return None, exc
+    return cli_main, None
+
+
 def _build_parser() -> argparse.ArgumentParser:
     p = argparse.ArgumentParser(
         prog="skillmesh-roles",
@@ -66,7 +109,7 @@ def _build_parser() -> argparse.ArgumentParser:
     sub = p.add_subparsers(dest="command", required=False)
 
     cmd_list = sub.add_parser("list", help="List available role bundles from catalog")
-    cmd_list.add_argument("--catalog", default=_default_catalog())
+    cmd_list.add_argument("--catalog", default=None)
     cmd_list.add_argument(
         "--registry",
         default="",
@@ -78,8 +121,8 @@ def _build_parser() -> argparse.ArgumentParser:
         "install",
         help="Install role card and missing dependency cards into target registry",
     )
-    cmd_install.add_argument("--catalog", default=_default_catalog())
-    cmd_install.add_argument("--registry", default=_default_target_registry())
+    cmd_install.add_argument("--catalog", default=None)
+    cmd_install.add_argument("--registry", default=None)
     cmd_install.add_argument("--role-id", required=True)
     cmd_install.add_argument("--dry-run", action="store_true")
     cmd_install.add_argument("--json", action="store_true")
@@ -88,8 +131,8 @@ def _build_parser() -> argparse.ArgumentParser:
         "wizard",
         help="Interactive role picker and installer",
     )
-    cmd_wizard.add_argument("--catalog", default=_default_catalog())
-    cmd_wizard.add_argument("--registry", default=_default_target_registry())
+    cmd_wizard.add_argument("--catalog", default=None)
+    cmd_wizard.add_argument("--registry", default=None)
     cmd_wizard.add_argument("--dry-run", action="store_true")
 
     return p
@@ -101,48 +144,55 @@ def main(argv: list[str] | None = None) -> int:
         arg_list = ["wizard"]
     args = _build_parser().parse_args(arg_list)
     command = str(getattr(args, "command", "") or "").strip().lower() or "wizard"
-    catalog = str(getattr(args, "catalog", "") or "").strip()
+    # Defaults probe env vars and the filesystem, so resolve them after parsing.
+    catalog = str(getattr(args, "catalog", None) or _default_catalog()).strip()
     cmd = ["skillmesh", "roles", command]
     if catalog:
-        catalog_path = Path(catalog).expanduser()
-        if not catalog_path.exists():
+        catalog_path = Path(catalog).expanduser().resolve(strict=False)
+        if not catalog_path.is_file():
             print(f"Error: Catalog not found: {catalog_path}", file=sys.stderr)
             return 2
-        cmd.extend(["--catalog", str(catalog_path.resolve())])
+        cmd.extend(["--catalog", str(catalog_path)])
     if command == "list":
         if args.registry:
             cmd.extend(["--registry", args.registry])
         if args.json:
             cmd.append("--json")
     elif command == "install":
-        cmd.extend(["--registry", args.registry, "--role-id", args.role_id])
+        registry = args.registry or _default_target_registry()
+        cmd.extend(["--registry", registry, "--role-id", args.role_id])
         if args.dry_run:
             cmd.append("--dry-run")
         if args.json:
             cmd.append("--json")
     else:
-        if args.registry:
-            cmd.extend(["--registry", args.registry])
-        if args.dry_run:
+        registry = getattr(args, "registry", None) or _default_target_registry()
+        cmd.extend(["--registry", registry])
+        if getattr(args, "dry_run", False):
             cmd.append("--dry-run")
 
-    env = os.environ.copy()
-    if shutil.which("skillmesh") is None:
-        repo_root = _find_repo_root()
-        if repo_root is not None:
-            src_path = repo_root / "src"
-            env["PYTHONPATH"] = str(src_path) + os.pathsep + env.get("PYTHONPATH", "")
-        cmd = [sys.executable, "-m", "skill_registry_rag", *cmd[1:]]
+    # Run the CLI in-process when the package is importable. _load_cli_main already
+    # tried the checkout's src/, so the only fallback left is a `skillmesh` on PATH.
+    cli_main, import_error = _load_cli_main()
+    if cli_main is not None:
+        return int(cli_main(cmd[1:]))
 
     try:
-        proc = subprocess.run(cmd, check=False, env=env)
+        if shutil.which("skillmesh") is None:
+            raise FileNotFoundError(cmd[0])
+        if os.name == "posix":
+            # Nothing runs after the child exits, so replace this process instead
+            # of forking and waiting. Windows emulates exec with a detached spawn.
+            sys.stdout.flush()
+            os.execvp(cmd[0], cmd)
+        proc = subprocess.run(cmd, check=False)
         return int(proc.returncode)
     except FileNotFoundError:
         pretty = " ".join(shlex.quote(c) for c in cmd)
         print(
             "Error: SkillMesh CLI is not installed.\n"
-            "Install with `pip install -e .` from the SkillMesh repo,\n"
-            "or run from a checkout with:\n"
+            f"Importing skill_registry_rag failed: {import_error}\n"
+            "Install with `pip install -e .` from the SkillMesh repo, then run:\n"
             f"  {pretty}",
             file=sys.stderr,
         )
@@ -99,12 +99,14 @@ def main(argv: list[str] | None = None) -> int:
         cmd.append("--dense")
 
     # Fallback to module invocation when CLI script is not on PATH.
-    env = os.environ.copy()
+    env = None
     if shutil.which("skillmesh") is None:
         repo_root = _find_repo_root()
         if repo_root is not None:
-            src_path = repo_root / "src"
-            env["PYTHONPATH"] = str(src_path) + os.pathsep + env.get("PYTHONPATH", "")
+            pythonpath = [str(repo_root / "src")]
+            if os.environ.get("PYTHONPATH"):
+                pythonpath.append(os.environ["PYTHONPATH"])
+            env = {**os.environ, "PYTHONPATH": os.pathsep.join(pythonpath)}
         cmd = [
             sys.executable,
             "-m",
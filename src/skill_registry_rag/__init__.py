@@ -1,10 +1,28 @@
 """skill-registry-rag package."""
 
-from .backends import RetrievalBackend
-from .backends.memory import InMemoryBackend
-from .models import ExpertCard, RetrievalHit, ToolCard
-from .registry import load_registry
-from .retriever import SkillRetriever
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .backends import RetrievalBackend
+    from .backends.memory import InMemoryBackend
+    from .models import ExpertCard, RetrievalHit, ToolCard
+    from .registry import load_registry
+    from .retriever import SkillRetriever
+
+# Public names resolve on first access so `skillmesh roles` and the MCP role tools
+# do not import numpy/BM25 just by importing a submodule of this package.
+_LAZY_EXPORTS = {
+    "ExpertCard": ".models",
+    "InMemoryBackend": ".backends.memory",
+    "RetrievalBackend": ".backends",
+    "RetrievalHit": ".models",
+    "SkillRetriever": ".retriever",
+    "ToolCard": ".models",
+    "load_registry": ".registry",
+}
 
 __all__ = [
     "ExpertCard",
@@ -15,3 +33,12 @@ __all__ = [
     "ToolCard",
     "load_registry",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
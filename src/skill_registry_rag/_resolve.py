@@ -2,10 +2,39 @@
 
 from __future__ import annotations
 
+import functools
 import os
 from pathlib import Path
 
 
+def env_flag(name: str) -> bool:
+    """Return True only when the environment variable ``name`` is set to ``1``."""
+    return os.getenv(name, "").strip() == "1"
+
+
+def file_signature(path: str | Path) -> tuple[int, int, int] | None:
+    """Return ``(mtime_ns, size, inode)`` for cache invalidation, or None if ``path`` is gone."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size, st.st_ino
+
+
+def resolve_path(raw: str | Path) -> Path:
+    """Return ``raw`` expanded and resolved, memoized per working directory.
+
+    Long-lived processes (the MCP server) resolve the same few paths on every call;
+    symlink changes under an already-resolved path need a restart to be seen.
+    """
+    return _resolve_path_cached(os.getcwd(), str(raw))
+
+
+@functools.lru_cache(maxsize=64)
+def _resolve_path_cached(cwd: str, raw: str) -> Path:
+    return Path(raw).expanduser().resolve()
+
+
 def _find_repo_root() -> Path | None:
     here = Path(__file__).resolve()
     markers = ("src/skill_registry_rag/__main__.py", "examples/registry/tools.json")
@@ -19,7 +48,7 @@ def _default_registry_path() -> Path | None:
     # 1. Env var
     env_path = os.getenv("SKILLMESH_REGISTRY", "").strip()
     if env_path:
-        candidate = Path(env_path).expanduser().resolve()
+        candidate = resolve_path(env_path)
         if not candidate.exists():
             raise ValueError(
                 f"SKILLMESH_REGISTRY points to a missing file: {candidate}"
@@ -43,7 +72,7 @@ def _default_registry_path() -> Path | None:
 def resolve_registry_path(registry: str | None = None) -> Path:
     """Resolve a registry path from explicit argument, env var, repo root, or bundled fallback."""
     if registry and registry.strip():
-        candidate = Path(registry).expanduser().resolve()
+        candidate = resolve_path(registry)
         if not candidate.exists():
             raise ValueError(f"Registry not found: {candidate}")
         return candidate
@@ -1,24 +1,20 @@
 from __future__ import annotations
 
 import argparse
+import functools
 import json
 import os
 import sys
 from pathlib import Path
 
 from ._resolve import resolve_registry_path
-from .adapters import render_claude_context, render_codex_context
-from .roles import (
-    RoleCatalogError,
-    friendly_role_name,
-    install_role_bundle,
-    list_role_offers,
-    resolve_role_selector,
-)
-from .registry import RegistryError, load_registry
-from .retriever import SkillRetriever
 
-_TOP_LEVEL_COMMANDS = {"index", "retrieve", "emit", "roles"}
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+_TOP_LEVEL_COMMANDS = frozenset({"index", "retrieve", "emit", "roles"})
 
 
 def _default_catalog_path() -> str:
@@ -43,37 +39,60 @@ def _default_role_registry_path() -> str:
     return str((Path.home() / ".codex" / "skills" / "skillmesh" / "installed.registry.yaml"))
 
 
+def _dumps(payload: object) -> str:
+    if orjson is not None:
+        options = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        return orjson.dumps(payload, option=options).decode("utf-8")
+    return json.dumps(payload, indent=2)
+
+
+def _write_lines(lines: list[str]) -> None:
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
 def _print_role_offers(offers: list[dict[str, object]], *, catalog: str, registry: str = "") -> None:
-    print(f"Catalog: {catalog}")
+    from .roles import friendly_role_name
+
+    lines = [f"Catalog: {catalog}"]
     if registry:
-        print(f"Installed registry: {registry}")
-    print(f"Roles available: {len(offers)}")
-    print("")
-    print("ROLE | DEPENDENCIES | INSTALLED | TITLE")
+        lines.append(f"Installed registry: {registry}")
+    lines.append(f"Roles available: {len(offers)}")
+    lines.append("")
+    lines.append("ROLE | DEPENDENCIES | INSTALLED | TITLE")
     for offer in offers:
         role_id = str(offer["id"])
         installed = "yes" if bool(offer["installed"]) else "no"
-        print(
+        lines.append(
             f"{friendly_role_name(role_id)} | {offer['dependency_count']} | "
             f"{installed} | {offer['title']}"
         )
+    _write_lines(lines)
 
 
 def _print_installed_roles(offers: list[dict[str, object]], *, registry: str) -> None:
+    from .roles import friendly_role_name
+
     installed = [offer for offer in offers if bool(offer["installed"])]
-    print(f"Installed registry: {registry}")
-    print(f"Installed roles: {len(installed)}")
+    lines = [f"Installed registry: {registry}", f"Installed roles: {len(installed)}"]
     if not installed:
-        print("No roles installed. Run `skillmesh roles wizard` or `skillmesh <Role-Name> install`.")
+        lines.append(
+            "No roles installed. Run `skillmesh roles wizard` or `skillmesh <Role-Name> install`."
+        )
+        _write_lines(lines)
         return
-    print("")
-    print("ROLE | DEPENDENCIES | TITLE")
+    lines.append("")
+    lines.append("ROLE | DEPENDENCIES | TITLE")
     for offer in installed:
         role_id = str(offer["id"])
-        print(f"{friendly_role_name(role_id)} | {offer['dependency_count']} | {offer['title']}")
+        lines.append(
+            f"{friendly_role_name(role_id)} | {offer['dependency_count']} | {offer['title']}"
+        )
+    _write_lines(lines)
 
 
 def _print_install_result(result: dict[str, object], *, dry_run: bool) -> None:
+    from .roles import friendly_role_name
+
     action = "Dry run for" if dry_run else "Installed"
     role_id = str(result["role_id"])
     print(f"{action} role bundle: {friendly_role_name(role_id)}")
@@ -101,23 +120,38 @@ def _print_install_result(result: dict[str, object], *, dry_run: bool) -> None:
         )
 
 
-def _run_roles_wizard(*, catalog: str, registry: str, dry_run: bool) -> int:
-    offers = list_role_offers(catalog_registry=catalog, installed_registry=(registry or None))
+def _run_roles_wizard(
+    offers: list[dict[str, object]],
+    *,
+    catalog: str,
+    registry: str,
+    dry_run: bool,
+) -> int:
+    from .roles import (
+        RoleCatalogError,
+        friendly_role_name,
+        install_role_bundle,
+        resolve_role_selector,
+    )
+
     if not offers:
         print("No roles found in catalog.")
         return 2
 
-    print("SkillMesh Role Wizard")
-    print(f"Catalog: {catalog}")
-    print(f"Target registry: {registry}")
-    print("")
+    lines = [
+        "SkillMesh Role Wizard",
+        f"Catalog: {catalog}",
+        f"Target registry: {registry}",
+        "",
+    ]
     for idx, offer in enumerate(offers, start=1):
         role_id = str(offer["id"])
         installed = "installed" if bool(offer["installed"]) else "new"
-        print(
+        lines.append(
             f"{idx}. {friendly_role_name(role_id)} ({offer['dependency_count']} deps, {installed})"
             f" - {offer['title']}"
         )
+    _write_lines(lines)
 
     selected_role_id = ""
     while not selected_role_id:
@@ -160,17 +194,19 @@ def _normalize_cli_argv(argv: list[str] | None) -> list[str]:
     if not args:
         return args
 
+    first = args[0].strip().lower()
+    second = args[1].strip().lower() if len(args) > 1 else ""
+
     # `skillmesh roles` -> show installed roles
-    if args[0].strip().lower() == "roles":
+    if first == "roles":
         if len(args) == 1 or args[1].startswith("-"):
             return ["roles", "installed", *args[1:]]
         return args
 
     # Friendly shorthand: `skillmesh Data-Analyst install`
     if (
-        len(args) >= 2
-        and args[1].strip().lower() == "install"
-        and args[0].strip().lower() not in _TOP_LEVEL_COMMANDS
+        second == "install"
+        and first not in _TOP_LEVEL_COMMANDS
         and not args[0].startswith("-")
     ):
         return ["roles", "install", "--role-id", args[0], *args[2:]]
@@ -178,7 +214,10 @@ def _normalize_cli_argv(argv: list[str] | None) -> list[str]:
     return args
 
 
+@functools.lru_cache(maxsize=1)
 def _build_parser() -> argparse.ArgumentParser:
+    # parse_args() returns a fresh Namespace and never mutates the parser, so a
+    # single instance can serve every main() call.
     parser = argparse.ArgumentParser(
         prog="skillmesh",
         description="Top-k SkillMesh tool/role card retrieval for Codex/Claude style runtimes.",
@@ -219,12 +258,12 @@ def _build_parser() -> argparse.ArgumentParser:
     roles_list = roles_sub.add_parser("list", help="List available role cards from catalog")
     roles_list.add_argument(
         "--catalog",
-        default=_default_catalog_path(),
+        default=None,
         help="Path to source tools/roles catalog YAML/JSON",
     )
     roles_list.add_argument(
         "--registry",
-        default=_default_role_registry_path(),
+        default=None,
         help="Optional installed registry path for showing installed/missing status",
     )
     roles_list.add_argument("--json", action="store_true", help="Emit JSON output")
@@ -235,12 +274,12 @@ def _build_parser() -> argparse.ArgumentParser:
     )
     roles_install.add_argument(
         "--catalog",
-        default=_default_catalog_path(),
+        default=None,
         help="Path to source tools/roles catalog YAML/JSON",
     )
     roles_install.add_argument(
         "--registry",
-        default=_default_role_registry_path(),
+        default=None,
         help="Target registry YAML/JSON to write role/dependency cards into",
     )
     roles_install.add_argument(
@@ -257,12 +296,12 @@ def _build_parser() -> argparse.ArgumentParser:
     )
     roles_wizard.add_argument(
         "--catalog",
-        default=_default_catalog_path(),
+        default=None,
         help="Path to source tools/roles catalog YAML/JSON",
     )
     roles_wizard.add_argument(
         "--registry",
-        default=_default_role_registry_path(),
+        default=None,
         help="Target registry YAML/JSON to write role/dependency cards into",
     )
     roles_wizard.add_argument("--dry-run", action="store_true", help="Show changes only")
@@ -273,12 +312,12 @@ def _build_parser() -> argparse.ArgumentParser:
     )
     roles_installed.add_argument(
         "--catalog",
-        default=_default_catalog_path(),
+        default=None,
         help="Path to source tools/roles catalog YAML/JSON",
     )
     roles_installed.add_argument(
         "--registry",
-        default=_default_role_registry_path(),
+        default=None,
         help="Installed registry YAML/JSON path",
     )
     roles_installed.add_argument("--json", action="store_true", help="Emit JSON output")
@@ -286,41 +325,23 @@ def _build_parser() -> argparse.ArgumentParser:
     return parser
 
 
-def _hits_payload(hits):
-    payload = []
-    for hit in hits:
-        payload.append(
-            {
-                "id": hit.card.id,
-                "title": hit.card.title,
-                "domain": hit.card.domain,
-                "description": hit.card.description,
-                "tags": hit.card.tags,
-                "tool_hints": hit.card.tool_hints,
-                "aliases": hit.card.aliases,
-                "dependencies": hit.card.dependencies,
-                "input_contract": hit.card.input_contract,
-                "output_artifacts": hit.card.output_artifacts,
-                "quality_checks": hit.card.quality_checks,
-                "constraints": hit.card.constraints,
-                "risk_level": hit.card.risk_level,
-                "maturity": hit.card.maturity,
-                "metadata": hit.card.metadata,
-                "score": hit.score,
-                "sparse_score": hit.sparse_score,
-                "dense_score": hit.dense_score,
-            }
-        )
-    return payload
-
-
 def main(argv: list[str] | None = None) -> int:
     normalized_argv = _normalize_cli_argv(argv)
     parser = _build_parser()
     args = parser.parse_args(normalized_argv)
 
+    # Heavy modules are imported per command so `roles` never pulls in the
+    # retrieval stack and `index`/`retrieve`/`emit` skip the role catalog code.
     if args.command == "roles":
-        catalog = str(getattr(args, "catalog", "") or "").strip()
+        from .roles import (
+            RoleCatalogError,
+            install_role_bundle,
+            list_role_offers,
+            resolve_role_selector,
+        )
+
+        # Role defaults probe env vars and the filesystem, so resolve them only here.
+        catalog = str(getattr(args, "catalog", None) or _default_catalog_path()).strip()
         if not catalog:
             print(
                 "Error: missing --catalog. Provide a catalog path or set SKILLMESH_CATALOG.",
@@ -328,23 +349,24 @@ def main(argv: list[str] | None = None) -> int:
             )
             return 2
 
-        registry = str(getattr(args, "registry", "") or "").strip()
+        registry = str(getattr(args, "registry", None) or _default_role_registry_path()).strip()
         try:
+            # Parse the catalog once and share the offers across every roles subcommand.
+            offers = list_role_offers(
+                catalog_registry=catalog,
+                installed_registry=(registry or None),
+            )
             if args.roles_command in {None, "installed", "list"}:
-                offers = list_role_offers(
-                    catalog_registry=catalog,
-                    installed_registry=(registry or None),
-                )
                 if args.roles_command in {None, "installed"}:
                     installed = [offer for offer in offers if bool(offer["installed"])]
                     if getattr(args, "json", False):
-                        print(json.dumps({"roles": installed}, indent=2))
+                        print(_dumps({"roles": installed}))
                         return 0
                     _print_installed_roles(offers, registry=registry)
                     return 0
 
                 if getattr(args, "json", False):
-                    print(json.dumps({"roles": offers}, indent=2))
+                    print(_dumps({"roles": offers}))
                     return 0
 
                 _print_role_offers(offers, catalog=catalog, registry=registry)
@@ -353,6 +375,7 @@ def main(argv: list[str] | None = None) -> int:
             if args.roles_command == "wizard":
                 try:
                     return _run_roles_wizard(
+                        offers,
                         catalog=catalog,
                         registry=registry,
                         dry_run=bool(args.dry_run),
@@ -361,8 +384,7 @@ def main(argv: list[str] | None = None) -> int:
                     print("\nCancelled.")
                     return 130
 
-            role_offers = list_role_offers(catalog_registry=catalog)
-            resolved_role_id = resolve_role_selector(args.role_id, role_offers)
+            resolved_role_id = resolve_role_selector(args.role_id, offers)
             result = install_role_bundle(
                 catalog_registry=catalog,
                 target_registry=registry,
@@ -370,7 +392,7 @@ def main(argv: list[str] | None = None) -> int:
                 dry_run=bool(args.dry_run),
             )
             if args.json:
-                print(json.dumps(result, indent=2))
+                print(_dumps(result))
                 return 0
 
             _print_install_result(result, dry_run=bool(args.dry_run))
@@ -379,6 +401,8 @@ def main(argv: list[str] | None = None) -> int:
             print(f"RoleCatalogError: {exc}", file=sys.stderr)
             return 2
 
+    from .registry import RegistryError, load_registry
+
     try:
         registry_path = resolve_registry_path(args.registry)
         cards = load_registry(registry_path)
@@ -398,6 +422,8 @@ def main(argv: list[str] | None = None) -> int:
         print(f"Indexed {len(cards)} cards into collection '{args.collection}'")
         return 0
 
+    from .retriever import SkillRetriever
+
     backend_choice = getattr(args, "backend", "auto")
     retriever = SkillRetriever(
         cards,
@@ -407,9 +433,11 @@ def main(argv: list[str] | None = None) -> int:
     hits = retriever.retrieve(args.query, top_k=args.top_k)
 
     if args.command == "retrieve":
-        print(json.dumps({"query": args.query, "hits": _hits_payload(hits)}, indent=2))
+        print(_dumps({"query": args.query, "hits": [hit.to_payload() for hit in hits]}))
         return 0
 
+    from .adapters import render_claude_context, render_codex_context
+
     if args.provider == "codex":
         out = render_codex_context(args.query, hits, instruction_chars=args.instruction_chars)
     else:
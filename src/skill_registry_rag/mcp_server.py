@@ -1,11 +1,14 @@
 from __future__ import annotations
 
+import functools
 import os
 import sys
+import threading
+from collections import OrderedDict
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-from ._resolve import resolve_registry_path
+from ._resolve import resolve_path, resolve_registry_path
 from .adapters import render_claude_context, render_codex_context
 from .roles import (
     RoleCatalogError,
@@ -14,17 +17,37 @@ from .roles import (
     list_role_offers,
     resolve_role_selector,
 )
-from .registry import RegistryError, load_registry
-from .retriever import SkillRetriever
+
+if TYPE_CHECKING:
+    from .models import ToolCard
+    from .retriever import SkillRetriever
 
 _VALID_PROVIDERS = {"claude", "codex"}
 _VALID_BACKENDS = {"auto", "memory", "chroma"}
 
+# Indexed in-memory retrievers keyed by (registry path, dense, backend). An entry is
+# fresh while its cards are the very list _load_registry_shared still returns.
+_RETRIEVER_CACHE: OrderedDict[
+    tuple[Path, bool, str], tuple[list[ToolCard], SkillRetriever]
+] = OrderedDict()
+_RETRIEVER_CACHE_LOCK = threading.Lock()
+_RETRIEVER_CACHE_SIZE = 4
+
 
 def _default_role_catalog_path() -> Path:
-    env_catalog = os.getenv("SKILLMESH_CATALOG", "").strip()
+    return _cached_default_role_catalog_path(
+        os.getenv("SKILLMESH_CATALOG", "").strip(),
+        os.getenv("SKILLMESH_REGISTRY", "").strip(),
+        os.getcwd(),
+    )
+
+
+@functools.lru_cache(maxsize=8)
+def _cached_default_role_catalog_path(env_catalog: str, env_registry: str, cwd: str) -> Path:
+    # `env_registry` and `cwd` only key the cache: relative env paths resolve against cwd
+    # and resolve_registry_path reads SKILLMESH_REGISTRY itself.
     if env_catalog:
-        candidate = Path(env_catalog).expanduser().resolve()
+        candidate = resolve_path(env_catalog)
         if not candidate.exists():
             raise ValueError(f"SKILLMESH_CATALOG points to a missing file: {candidate}")
         return candidate
@@ -32,18 +55,31 @@ def _default_role_catalog_path() -> Path:
 
 
 def _default_role_registry_path() -> Path:
-    role_registry = os.getenv("SKILLMESH_ROLE_REGISTRY", "").strip()
+    return _cached_default_role_registry_path(
+        os.getenv("SKILLMESH_ROLE_REGISTRY", "").strip(),
+        os.getenv("SKILLMESH_REGISTRY", "").strip(),
+        str(Path.home()),
+        os.getcwd(),
+    )
+
+
+@functools.lru_cache(maxsize=8)
+def _cached_default_role_registry_path(
+    role_registry: str,
+    env_registry: str,
+    home: str,
+    cwd: str,
+) -> Path:
     if role_registry:
-        return Path(role_registry).expanduser().resolve()
-    env_registry = os.getenv("SKILLMESH_REGISTRY", "").strip()
+        return resolve_path(role_registry)
     if env_registry:
-        return Path(env_registry).expanduser().resolve()
-    return (Path.home() / ".codex" / "skills" / "skillmesh" / "installed.registry.yaml").resolve()
+        return resolve_path(env_registry)
+    return (Path(home) / ".codex" / "skills" / "skillmesh" / "installed.registry.yaml").resolve()
 
 
 def _resolve_role_catalog_path(catalog: str | None) -> Path:
     if catalog and catalog.strip():
-        candidate = Path(catalog).expanduser().resolve()
+        candidate = resolve_path(catalog)
         if not candidate.exists():
             raise ValueError(f"Catalog not found: {candidate}")
         return candidate
@@ -52,7 +88,7 @@ def _resolve_role_catalog_path(catalog: str | None) -> Path:
 
 def _resolve_role_registry_path(registry: str | None) -> Path:
     if registry and registry.strip():
-        return Path(registry).expanduser().resolve()
+        return resolve_path(registry)
     return _default_role_registry_path()
 
 
@@ -102,19 +138,42 @@ def _retrieve_hits(
     resolved_top_k = _normalize_top_k(top_k)
     resolved_backend = _normalize_backend(backend)
     registry_path = resolve_registry_path(registry)
+    retriever = _get_retriever(registry_path, dense=bool(dense), backend=resolved_backend)
+    hits = retriever.retrieve(resolved_query, top_k=resolved_top_k)
+    return resolved_query, registry_path, hits
+
+
+def _get_retriever(registry_path: Path, *, dense: bool, backend: str) -> SkillRetriever:
+    # The retrieval stack (numpy, BM25) is imported on first use so role-only
+    # tool calls keep a light server start-up.
+    from .backends.memory import InMemoryBackend
+    from .registry import RegistryError, _load_registry_shared
+    from .retriever import SkillRetriever
 
     try:
-        cards = load_registry(registry_path)
+        # The shared list keeps its identity until the registry, schema or any
+        # instruction file changes, so it doubles as the retriever's cache version.
+        cards = _load_registry_shared(registry_path)
     except RegistryError as exc:
         raise ValueError(f"Invalid registry: {exc}") from exc
 
-    retriever = SkillRetriever(
-        cards,
-        use_dense=bool(dense),
-        backend=resolved_backend,
-    )
-    hits = retriever.retrieve(resolved_query, top_k=resolved_top_k)
-    return resolved_query, registry_path, hits
+    key = (registry_path, dense, backend)
+    with _RETRIEVER_CACHE_LOCK:
+        cached = _RETRIEVER_CACHE.get(key)
+        if cached is not None and cached[0] is cards:
+            _RETRIEVER_CACHE.move_to_end(key)
+            return cached[1]
+
+    retriever = SkillRetriever(cards, use_dense=dense, backend=backend)
+    # Chroma retrievers share one persistent collection, so only in-memory indexes
+    # are safe to keep around between calls.
+    if isinstance(retriever.backend, InMemoryBackend):
+        with _RETRIEVER_CACHE_LOCK:
+            _RETRIEVER_CACHE[key] = (cards, retriever)
+            _RETRIEVER_CACHE.move_to_end(key)
+            while len(_RETRIEVER_CACHE) > _RETRIEVER_CACHE_SIZE:
+                _RETRIEVER_CACHE.popitem(last=False)
+    return retriever
 
 
 def retrieve_cards_payload(
@@ -132,35 +191,10 @@ def retrieve_cards_payload(
         backend=backend,
         dense=dense,
     )
-    payload_hits: list[dict[str, Any]] = []
-    for hit in hits:
-        payload_hits.append(
-            {
-                "id": hit.card.id,
-                "title": hit.card.title,
-                "domain": hit.card.domain,
-                "description": hit.card.description,
-                "tags": hit.card.tags,
-                "tool_hints": hit.card.tool_hints,
-                "aliases": hit.card.aliases,
-                "dependencies": hit.card.dependencies,
-                "input_contract": hit.card.input_contract,
-                "output_artifacts": hit.card.output_artifacts,
-                "quality_checks": hit.card.quality_checks,
-                "constraints": hit.card.constraints,
-                "risk_level": hit.card.risk_level,
-                "maturity": hit.card.maturity,
-                "metadata": hit.card.metadata,
-                "score": hit.score,
-                "sparse_score": hit.sparse_score,
-                "dense_score": hit.dense_score,
-            }
-        )
-
     return {
         "query": resolved_query,
         "registry": str(registry_path),
-        "hits": payload_hits,
+        "hits": [hit.to_payload() for hit in hits],
     }
 
 
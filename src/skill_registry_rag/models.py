@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import operator
 from dataclasses import dataclass, field
 from typing import Any, Optional
 
@@ -26,6 +27,26 @@ class ToolCard:
     instruction_text: str = ""
 
 
+_PAYLOAD_CARD_FIELDS = (
+    "id",
+    "title",
+    "domain",
+    "description",
+    "tags",
+    "tool_hints",
+    "aliases",
+    "dependencies",
+    "input_contract",
+    "output_artifacts",
+    "quality_checks",
+    "constraints",
+    "risk_level",
+    "maturity",
+    "metadata",
+)
+_payload_card_values = operator.attrgetter(*_PAYLOAD_CARD_FIELDS)
+
+
 @dataclass(slots=True)
 class RetrievalHit:
     card: ToolCard
@@ -33,6 +54,14 @@ class RetrievalHit:
     sparse_score: float
     dense_score: Optional[float] = None
 
+    def to_payload(self) -> dict[str, Any]:
+        """Return the JSON-ready card fields plus scores used by CLI/MCP output."""
+        payload = dict(zip(_PAYLOAD_CARD_FIELDS, _payload_card_values(self.card)))
+        payload["score"] = self.score
+        payload["sparse_score"] = self.sparse_score
+        payload["dense_score"] = self.dense_score
+        return payload
+
 
 # Backward-compatible alias for older imports.
 ExpertCard = ToolCard
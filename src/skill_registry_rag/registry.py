@@ -1,13 +1,31 @@
 from __future__ import annotations
 
+import copy
 import json
+import threading
+from collections import OrderedDict
 from pathlib import Path
 from typing import Any
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # pragma: no cover - PyYAML built without libyaml
+    from yaml import SafeLoader as _SafeLoader
+
+from ._resolve import env_flag, file_signature
 from .models import ToolCard
 
+# Loaded cards keyed by (registry path, validate flag, schema path). Each entry records
+# the signature of every file it was built from and is reused only while they all match.
+_CARDS_CACHE: OrderedDict[
+    tuple[Path, bool, Path | None],
+    tuple[tuple[tuple[Path, tuple[int, int, int] | None], ...], list[ToolCard]],
+] = OrderedDict()
+_CARDS_CACHE_LOCK = threading.Lock()
+_CARDS_CACHE_SIZE = 8
+
 
 class RegistryError(ValueError):
     """Raised when the tool/role registry is invalid."""
@@ -50,7 +68,7 @@ def _read_structured(path: Path) -> Any:
     text = path.read_text(encoding="utf-8")
     suffix = path.suffix.lower()
     if suffix in {".yaml", ".yml"}:
-        return yaml.safe_load(text)
+        return yaml.load(text, Loader=_SafeLoader)
     if suffix == ".json":
         return json.loads(text)
     raise RegistryError(f"Unsupported registry extension: {suffix}")
@@ -127,17 +145,61 @@ def load_registry(
     path = Path(registry_path).expanduser().resolve()
     if not path.exists():
         raise RegistryError(f"Registry not found: {path}")
+    schema = Path(schema_path).expanduser().resolve() if schema_path is not None else None
+    # Callers own what they get back; the cached cards are never handed out.
+    return copy.deepcopy(_load_registry_shared(path, validate_schema, schema))
+
 
+def _load_registry_shared(
+    path: Path,
+    validate_schema: bool = True,
+    schema_path: Path | None = None,
+) -> list[ToolCard]:
+    """Return the cached cards for ``path``, reloading when any source file changed.
+
+    The list and its cards are shared between callers and must be treated as read-only.
+    The same list object is returned for as long as the cache entry stays valid.
+    """
+    if env_flag("SKILLMESH_DISABLE_YAML_CACHE"):
+        return _load_registry_uncached(path, validate_schema, schema_path)[0]
+
+    key = (path, validate_schema, schema_path)
+    with _CARDS_CACHE_LOCK:
+        cached = _CARDS_CACHE.get(key)
+        if cached is not None:
+            _CARDS_CACHE.move_to_end(key)
+    if cached is not None:
+        signatures, cards = cached
+        if all(file_signature(dep) == sig for dep, sig in signatures):
+            return cards
+
+    # Stat before reading so a write racing with the load invalidates the entry.
+    deps = [path]
+    if validate_schema:
+        deps.append(schema_path if schema_path is not None else path.parent / "schema.json")
+    signatures = [(dep, file_signature(dep)) for dep in deps]
+    cards, instruction_paths = _load_registry_uncached(path, validate_schema, schema_path)
+    signatures.extend((dep, file_signature(dep)) for dep in instruction_paths)
+    with _CARDS_CACHE_LOCK:
+        _CARDS_CACHE[key] = (tuple(signatures), cards)
+        _CARDS_CACHE.move_to_end(key)
+        while len(_CARDS_CACHE) > _CARDS_CACHE_SIZE:
+            _CARDS_CACHE.popitem(last=False)
+    return cards
+
+
+def _load_registry_uncached(
+    path: Path,
+    validate_schema: bool,
+    schema_path: Path | None,
+) -> tuple[list[ToolCard], list[Path]]:
     raw = _read_structured(path)
     if validate_schema:
-        _validate_schema(
-            raw,
-            path,
-            Path(schema_path).expanduser().resolve() if schema_path is not None else None,
-        )
+        _validate_schema(raw, path, schema_path)
     entries = _normalize_entries(raw)
 
     cards: list[ToolCard] = []
+    instruction_paths: list[Path] = []
     seen_ids: set[str] = set()
     root = path.parent
 
@@ -160,6 +222,7 @@ def load_registry(
                     f"Instruction file missing for '{card_id}': {instruction_path}"
                 )
             instruction_text = instruction_path.read_text(encoding="utf-8").strip()
+            instruction_paths.append(instruction_path)
 
         card = ToolCard(
             id=card_id,
@@ -189,4 +252,4 @@ def load_registry(
         )
         cards.append(card)
 
-    return cards
+    return cards, instruction_paths
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from .backends import RetrievalBackend
 from .backends.memory import InMemoryBackend
 from .models import ExpertCard, RetrievalHit
 
@@ -21,5 +22,9 @@ class SkillRetriever:
                 self._backend = InMemoryBackend(use_dense=use_dense)
         self._backend.index(cards)
 
+    @property
+    def backend(self) -> RetrievalBackend:
+        return self._backend
+
     def retrieve(self, query: str, top_k: int = 3) -> list[RetrievalHit]:
         return self._backend.query(query, top_k=top_k)
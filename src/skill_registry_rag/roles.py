@@ -1,23 +1,58 @@
 from __future__ import annotations
 
 import copy
+import functools
+import glob
 import json
+import mmap
+import os
+import pickle
 import re
 import shutil
+import stat
+import threading
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
-import yaml
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+from ._resolve import env_flag, file_signature, resolve_path
 
 
 _SUPPORTED_SUFFIXES = {".json", ".yaml", ".yml"}
 _ROLE_DEPENDENCY_ID_RE = re.compile(r"`([A-Za-z0-9._-]+)`")
+_ROLE_DEPENDENCY_SECTION_RE = re.compile(
+    r"^[ \t]*##[ \t]+allowed expert dependencies[^\n]*(?:\n|\Z)(.*?)(?=^[ \t]*##[ \t]|\Z)",
+    re.IGNORECASE | re.MULTILINE | re.DOTALL,
+)
+
+# Parsed registry documents keyed by path, invalidated by (mtime_ns, size, inode).
+# LRU-bounded: the MCP server accepts arbitrary registry paths for its whole lifetime.
+_DOC_CACHE: OrderedDict[Path, tuple[tuple[int, int, int], Any]] = OrderedDict()
+_DOC_CACHE_LOCK = threading.Lock()
+_DOC_CACHE_SIZE = 8
+# JSON documents at least this large are parsed straight from a read-only mapping.
+_MMAP_MIN_BYTES = 1 << 20
+# Fewer uncached role markdown files than this are parsed serially.
+_PREFETCH_MIN_FILES = 4
+# Role dependency ids parsed from instruction markdown, invalidated by mtime_ns.
+# Filled from prefetch worker threads, hence the lock; sized for a few large catalogs.
+_DEP_CACHE: OrderedDict[Path, tuple[int, list[str]]] = OrderedDict()
+_DEP_CACHE_LOCK = threading.Lock()
+_DEP_CACHE_SIZE = 256
 
 
 class RoleCatalogError(ValueError):
     """Raised when role catalog operations fail."""
 
 
+@functools.lru_cache(maxsize=256)
 def friendly_role_name(role_id: str) -> str:
     suffix = str(role_id).strip().split(".", 1)[-1]
     chunks = [part for part in suffix.replace("_", "-").split("-") if part]
@@ -78,27 +113,131 @@ def resolve_role_selector(selector: str, offers: list[dict[str, Any]]) -> str:
     raise RoleCatalogError(f"Ambiguous role selector '{selected}'. Matches: {pretty}")
 
 
-def _read_registry_document(path: Path) -> Any:
-    text = path.read_text(encoding="utf-8")
+@functools.lru_cache(maxsize=1)
+def _yaml_codecs() -> tuple[Any, Any, Any]:
+    # PyYAML is only imported once a YAML registry is actually read or written.
+    import yaml
+
+    try:
+        from yaml import CSafeDumper as dumper
+        from yaml import CSafeLoader as loader
+    except ImportError:  # pragma: no cover - PyYAML built without libyaml
+        from yaml import SafeDumper as dumper
+        from yaml import SafeLoader as loader
+    return yaml, loader, dumper
+
+
+def _parse_registry_document(path: Path) -> Any:
     suffix = path.suffix.lower()
     if suffix in {".yaml", ".yml"}:
-        return yaml.safe_load(text)
+        yaml, loader, _ = _yaml_codecs()
+        return yaml.load(path.read_text(encoding="utf-8"), Loader=loader)
     if suffix == ".json":
-        return json.loads(text)
+        if orjson is None:
+            return json.loads(path.read_text(encoding="utf-8"))
+        with path.open("rb") as fh:
+            if os.fstat(fh.fileno()).st_size < _MMAP_MIN_BYTES:
+                return orjson.loads(fh.read())
+            with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+                return orjson.loads(view)
     raise RoleCatalogError(f"Unsupported registry extension: {suffix}")
 
 
+def _load_compiled_document(path: Path, sig: tuple[int, int, int]) -> Any:
+    """Parse a YAML registry through a pickle kept next to it, keyed by mtime and size.
+
+    Opt-in via ``SKILLMESH_COMPILED_CACHE=1``: only enable it for directories you trust,
+    since the pickle is loaded as-is.
+    """
+    mtime_ns, size, _ = sig
+    cache_path = path.with_name(f"{path.name}.{mtime_ns}-{size}.pkl")
+    try:
+        with cache_path.open("rb") as fh:
+            return pickle.load(fh)
+    except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError):
+        # Missing, truncated or incompatible pickles fall through to a fresh parse.
+        pass
+
+    document = _parse_registry_document(path)
+    try:
+        _atomic_write_bytes(cache_path, pickle.dumps(document, protocol=pickle.HIGHEST_PROTOCOL))
+        for stale in path.parent.glob(f"{glob.escape(path.name)}.*.pkl"):
+            if stale != cache_path:
+                stale.unlink(missing_ok=True)
+    except OSError:
+        # Read-only directories simply skip the compiled cache.
+        pass
+    return document
+
+
+def _read_registry_document(path: Path, *, shared: bool = False) -> Any:
+    """Parse a registry document, reusing the previous parse while the file is unchanged.
+
+    Cached documents are deep-copied unless ``shared`` is set, which callers may only
+    do when they never mutate the result.
+    """
+    if env_flag("SKILLMESH_DISABLE_YAML_CACHE"):
+        return _parse_registry_document(path)
+
+    sig = file_signature(path)
+    if sig is None:
+        return _parse_registry_document(path)
+    with _DOC_CACHE_LOCK:
+        cached = _DOC_CACHE.get(path)
+        if cached is not None:
+            _DOC_CACHE.move_to_end(path)
+    if cached is not None and cached[0] == sig:
+        document = cached[1]
+    else:
+        if path.suffix.lower() in {".yaml", ".yml"} and env_flag("SKILLMESH_COMPILED_CACHE"):
+            document = _load_compiled_document(path, sig)
+        else:
+            document = _parse_registry_document(path)
+        with _DOC_CACHE_LOCK:
+            _DOC_CACHE[path] = (sig, document)
+            _DOC_CACHE.move_to_end(path)
+            while len(_DOC_CACHE) > _DOC_CACHE_SIZE:
+                _DOC_CACHE.popitem(last=False)
+    return document if shared else copy.deepcopy(document)
+
+
+def _atomic_write_bytes(path: Path, data: bytes) -> None:
+    # Readers never observe a half-written file, and the new inode invalidates _DOC_CACHE.
+    # O_EXCL on a random name gives every writer (thread or process) its own temp file,
+    # and creating it with 0o666 lets the kernel apply the umask exactly as a plain write.
+    try:
+        mode: int | None = stat.S_IMODE(path.stat().st_mode)
+    except FileNotFoundError:
+        mode = None
+    tmp_path = path.with_name(f".{path.name}.{uuid.uuid4().hex}.tmp")
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+    try:
+        with os.fdopen(fd, "wb") as fh:
+            fh.write(data)
+        if mode is not None:
+            os.chmod(tmp_path, mode)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
 def _write_registry_document(path: Path, payload: Any) -> None:
     suffix = path.suffix.lower()
     if suffix not in _SUPPORTED_SUFFIXES:
         raise RoleCatalogError(f"Unsupported registry extension: {suffix}")
 
     if suffix == ".json":
-        path.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
-        return
-
-    dumped = yaml.safe_dump(payload, sort_keys=False, allow_unicode=False)
-    path.write_text(dumped, encoding="utf-8")
+        if orjson is not None:
+            options = orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS
+            data = orjson.dumps(payload, option=options)
+        else:
+            data = (json.dumps(payload, indent=2) + "\n").encode("utf-8")
+    else:
+        yaml, _, dumper = _yaml_codecs()
+        dumped = yaml.dump(payload, Dumper=dumper, sort_keys=False, allow_unicode=False)
+        data = dumped.encode("utf-8")
+    _atomic_write_bytes(path, data)
 
 
 def _normalize_entries(payload: Any, *, path: Path) -> tuple[dict[str, Any], str]:
@@ -109,13 +248,14 @@ def _normalize_entries(payload: Any, *, path: Path) -> tuple[dict[str, Any], str
     if not isinstance(payload, dict):
         raise RoleCatalogError(f"Registry must be list/object: {path}")
 
+    # Always hand back a fresh outer dict so callers may reassign the entries
+    # key without touching a (possibly cached) parsed document.
     if isinstance(payload.get("tools"), list):
-        return payload, "tools"
+        return {**payload}, "tools"
     if isinstance(payload.get("roles"), list):
-        return payload, "roles"
-    if payload == {}:
-        payload["tools"] = []
-        return payload, "tools"
+        return {**payload}, "roles"
+    if not payload:
+        return {"tools": []}, "tools"
 
     raise RoleCatalogError(
         f"Registry object must include one of 'tools' or 'roles': {path}"
@@ -127,90 +267,162 @@ def _entry_id(entry: dict[str, Any]) -> str:
 
 
 def _unique(values: list[str]) -> list[str]:
-    seen: set[str] = set()
-    out: list[str] = []
-    for value in values:
-        normalized = str(value).strip()
-        if not normalized or normalized in seen:
-            continue
-        seen.add(normalized)
-        out.append(normalized)
-    return out
+    stripped = (value.strip() if isinstance(value, str) else str(value).strip() for value in values)
+    return list(dict.fromkeys(value for value in stripped if value))
+
+
+def _clone_json_entry(entry: dict[str, Any]) -> dict[str, Any]:
+    """Deep-copy a JSON-sourced entry with a serializer round-trip (faster than deepcopy)."""
+    try:
+        if orjson is not None:
+            return orjson.loads(orjson.dumps(entry))
+        return json.loads(json.dumps(entry))
+    except (TypeError, ValueError):
+        return copy.deepcopy(entry)
 
 
 def _is_role_entry(entry: dict[str, Any]) -> bool:
-    card_id = _entry_id(entry)
-    if card_id.startswith("role."):
+    card_id = entry.get("id", "")
+    if isinstance(card_id, str) and card_id.startswith("role."):
+        return True
+    if _entry_id(entry).startswith("role."):
         return True
     if str(entry.get("domain", "")).strip().lower() == "role_orchestrator":
         return True
 
     tags = entry.get("tags")
     if isinstance(tags, list):
-        tag_set = {str(x).strip().lower() for x in tags if str(x).strip()}
-        if "role" in tag_set:
-            return True
+        return any(str(tag).strip().lower() == "role" for tag in tags)
 
     return False
 
 
+def _index_catalog_entries(
+    entries: list[Any],
+) -> tuple[dict[str, dict[str, Any]], list[tuple[str, dict[str, Any]]]]:
+    """Return ``(by_id, role_entries)`` from a single pass over catalog entries."""
+    by_id: dict[str, dict[str, Any]] = {}
+    role_entries: list[tuple[str, dict[str, Any]]] = []
+    for entry in entries:
+        if not isinstance(entry, dict):
+            continue
+        entry_id = _entry_id(entry)
+        if entry_id:
+            by_id[entry_id] = entry
+        if _is_role_entry(entry):
+            role_entries.append((entry_id, entry))
+    return by_id, role_entries
+
+
+def _entries_by_id(entries: list[Any]) -> dict[str, dict[str, Any]]:
+    return {
+        entry_id: entry
+        for entry in entries
+        if isinstance(entry, dict) and (entry_id := _entry_id(entry))
+    }
+
+
+def _entry_ids(entries: list[Any]) -> set[str]:
+    return {
+        entry_id
+        for entry in entries
+        if isinstance(entry, dict) and (entry_id := _entry_id(entry))
+    }
+
+
 def _parse_role_dependencies_from_instruction(instruction_path: Path) -> list[str]:
-    if not instruction_path.exists():
+    try:
+        mtime_ns = instruction_path.stat().st_mtime_ns
+    except FileNotFoundError:
         return []
 
-    text = instruction_path.read_text(encoding="utf-8")
-    lines = text.splitlines()
-    start_idx = None
-    for idx, line in enumerate(lines):
-        if line.strip().lower().startswith("## allowed expert dependencies"):
-            start_idx = idx + 1
-            break
-
-    if start_idx is None:
-        return []
+    with _DEP_CACHE_LOCK:
+        cached = _DEP_CACHE.get(instruction_path)
+        if cached is not None:
+            _DEP_CACHE.move_to_end(instruction_path)
+    if cached is not None and cached[0] == mtime_ns:
+        return list(cached[1])
 
+    text = instruction_path.read_text(encoding="utf-8")
+    section = _ROLE_DEPENDENCY_SECTION_RE.search(text)
     dependency_ids: list[str] = []
-    for line in lines[start_idx:]:
-        stripped = line.strip()
-        if stripped.startswith("## "):
-            break
-        for match in _ROLE_DEPENDENCY_ID_RE.findall(stripped):
-            dependency_ids.append(match.strip())
-    return _unique(dependency_ids)
+    if section is not None:
+        # Scan the section span in place; matched ids are non-empty and contain no
+        # whitespace, so order-preserving dedup is all that is left to do.
+        matches = _ROLE_DEPENDENCY_ID_RE.findall(text, section.start(1), section.end(1))
+        dependency_ids = list(dict.fromkeys(matches))
+    with _DEP_CACHE_LOCK:
+        _DEP_CACHE[instruction_path] = (mtime_ns, dependency_ids)
+        _DEP_CACHE.move_to_end(instruction_path)
+        while len(_DEP_CACHE) > _DEP_CACHE_SIZE:
+            _DEP_CACHE.popitem(last=False)
+    return list(dependency_ids)
+
+
+def _role_instruction_fallback_path(
+    role_entry: dict[str, Any],
+    *,
+    catalog_root: Path,
+) -> Path | None:
+    """Return the role markdown to parse when the entry lists no explicit dependencies."""
+    dependencies = role_entry.get("dependencies")
+    if isinstance(dependencies, list) and _unique(dependencies):
+        return None
+    instruction_file = str(role_entry.get("instruction_file", "")).strip()
+    if not instruction_file:
+        return None
+    return (catalog_root / instruction_file).resolve()
 
 
 def _resolve_role_dependencies(
     role_entry: dict[str, Any],
     *,
     catalog_root: Path,
-    known_ids: set[str],
+    known_ids: frozenset[str],
 ) -> list[str]:
     dependencies = role_entry.get("dependencies")
     dep_ids = _unique(dependencies if isinstance(dependencies, list) else [])
 
     if not dep_ids:
-        instruction_file = str(role_entry.get("instruction_file", "")).strip()
-        if instruction_file:
-            dep_ids = _parse_role_dependencies_from_instruction(
-                (catalog_root / instruction_file).resolve()
-            )
+        instruction_path = _role_instruction_fallback_path(role_entry, catalog_root=catalog_root)
+        if instruction_path is not None:
+            dep_ids = _parse_role_dependencies_from_instruction(instruction_path)
 
     if not dep_ids:
         tool_hints = role_entry.get("tool_hints")
         if isinstance(tool_hints, list):
-            dep_ids = _unique(
-                [str(x).strip() for x in tool_hints if str(x).strip() in known_ids]
-            )
+            hints = (str(x).strip() for x in tool_hints)
+            dep_ids = _unique([hint for hint in hints if hint in known_ids])
 
     return dep_ids
 
 
+def _prefetch_role_dependencies(
+    role_entries: list[tuple[str, dict[str, Any]]],
+    *,
+    catalog_root: Path,
+) -> None:
+    """Parse uncached role markdown files concurrently to warm ``_DEP_CACHE``."""
+    candidates = [
+        _role_instruction_fallback_path(entry, catalog_root=catalog_root)
+        for _, entry in role_entries
+    ]
+    with _DEP_CACHE_LOCK:
+        pending = [path for path in candidates if path is not None and path not in _DEP_CACHE]
+
+    # Thread start-up outweighs the overlap for a handful of small files.
+    if len(pending) < _PREFETCH_MIN_FILES:
+        return
+    with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 4)) as pool:
+        list(pool.map(_parse_role_dependencies_from_instruction, pending))
+
+
 def _load_catalog(path: str | Path) -> tuple[Path, dict[str, Any], str, list[dict[str, Any]]]:
-    catalog_path = Path(path).expanduser().resolve()
+    catalog_path = resolve_path(path)
     if not catalog_path.exists():
         raise RoleCatalogError(f"Catalog registry not found: {catalog_path}")
 
-    payload = _read_registry_document(catalog_path)
+    payload = _read_registry_document(catalog_path, shared=True)
     normalized, key = _normalize_entries(payload, path=catalog_path)
     entries = normalized[key]
     if not isinstance(entries, list):
@@ -219,10 +431,14 @@ def _load_catalog(path: str | Path) -> tuple[Path, dict[str, Any], str, list[dic
     return catalog_path, normalized, key, entries
 
 
-def _load_target_registry(path: str | Path) -> tuple[Path, dict[str, Any], str, list[dict[str, Any]]]:
-    target_path = Path(path).expanduser().resolve()
+def _load_target_registry(
+    path: str | Path,
+    *,
+    shared: bool = False,
+) -> tuple[Path, dict[str, Any], str, list[dict[str, Any]]]:
+    target_path = resolve_path(path)
     if target_path.exists():
-        payload = _read_registry_document(target_path)
+        payload = _read_registry_document(target_path, shared=shared)
         normalized, key = _normalize_entries(payload, path=target_path)
         entries = normalized[key]
         if not isinstance(entries, list):
@@ -242,27 +458,18 @@ def list_role_offers(
 ) -> list[dict[str, Any]]:
     catalog_path, _, _, catalog_entries = _load_catalog(catalog_registry)
     catalog_root = catalog_path.parent
-    by_id = {
-        _entry_id(entry): entry
-        for entry in catalog_entries
-        if isinstance(entry, dict) and _entry_id(entry)
-    }
-    known_ids = set(by_id)
+    by_id, role_entries = _index_catalog_entries(catalog_entries)
+    known_ids = frozenset(by_id)
 
-    installed_ids: set[str] = set()
+    installed_ids: frozenset[str] = frozenset()
     if installed_registry:
-        _, _, _, installed_entries = _load_target_registry(installed_registry)
-        installed_ids = {
-            _entry_id(entry)
-            for entry in installed_entries
-            if isinstance(entry, dict) and _entry_id(entry)
-        }
+        _, _, _, installed_entries = _load_target_registry(installed_registry, shared=True)
+        installed_ids = frozenset(_entry_ids(installed_entries))
+
+    _prefetch_role_dependencies(role_entries, catalog_root=catalog_root)
 
     offers: list[dict[str, Any]] = []
-    for entry in catalog_entries:
-        if not isinstance(entry, dict) or not _is_role_entry(entry):
-            continue
-        role_id = _entry_id(entry)
+    for role_id, entry in role_entries:
         deps = _resolve_role_dependencies(
             entry,
             catalog_root=catalog_root,
@@ -301,12 +508,8 @@ def install_role_bundle(
     catalog_path, _, _, catalog_entries = _load_catalog(catalog_registry)
     catalog_root = catalog_path.parent
 
-    catalog_by_id = {
-        _entry_id(entry): entry
-        for entry in catalog_entries
-        if isinstance(entry, dict) and _entry_id(entry)
-    }
-    known_ids = set(catalog_by_id)
+    catalog_by_id = _entries_by_id(catalog_entries)
+    known_ids = frozenset(catalog_by_id)
 
     role_entry = catalog_by_id.get(normalized_role_id)
     if role_entry is None:
@@ -324,11 +527,10 @@ def install_role_bundle(
     target_path, target_payload, target_key, target_entries = _load_target_registry(
         target_registry
     )
-    existing_ids = {
-        _entry_id(entry)
-        for entry in target_entries
-        if isinstance(entry, dict) and _entry_id(entry)
-    }
+    existing_ids = _entry_ids(target_entries)
+
+    # YAML values (dates, non-string keys) do not survive a JSON round-trip.
+    clone_entry = _clone_json_entry if catalog_path.suffix.lower() == ".json" else copy.deepcopy
 
     added_ids: list[str] = []
     already_present: list[str] = []
@@ -344,7 +546,7 @@ def install_role_bundle(
             unresolved_dependencies.append(card_id)
             continue
 
-        entry_copy = copy.deepcopy(entry)
+        entry_copy = clone_entry(entry)
         instruction_file = str(entry_copy.get("instruction_file", "")).strip()
         if instruction_file:
             source_instruction = (catalog_root / instruction_file).resolve()
@@ -355,7 +557,9 @@ def install_role_bundle(
                     copied_instruction_files.append(str(target_instruction))
                 elif not dry_run and not target_instruction.exists():
                     target_instruction.parent.mkdir(parents=True, exist_ok=True)
-                    shutil.copy2(source_instruction, target_instruction)
+                    # Contents only: the installed copy does not need the catalog's
+                    # mtime/mode, and copyfile lets the OS use copy_file_range/sendfile.
+                    shutil.copyfile(source_instruction, target_instruction)
                     copied_instruction_files.append(str(target_instruction))
             elif inline_instruction:
                 if dry_run and not target_instruction.exists():
@@ -374,7 +578,8 @@ def install_role_bundle(
 
     target_payload[target_key] = target_entries
 
-    if not dry_run:
+    # Re-installing an already present bundle leaves the registry untouched.
+    if not dry_run and added_ids:
         target_path.parent.mkdir(parents=True, exist_ok=True)
         _write_registry_document(target_path, target_payload)
 
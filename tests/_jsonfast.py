@@ -0,0 +1,36 @@
+"""Fastest available JSON codec for the test suite.
+
+Named ``_jsonfast`` rather than ``_json`` so it cannot shadow CPython's own
+``_json`` accelerator module when ``tests/`` is on ``sys.path``.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover - optional speedup
+    msgspec = None
+
+
+def loads(data: str | bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    if msgspec is not None:
+        return msgspec.json.decode(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any, *, indent: bool = False) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    if msgspec is not None and not indent:
+        return msgspec.json.encode(obj)
+    return json.dumps(obj, indent=2 if indent else None).encode("utf-8")
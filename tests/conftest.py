@@ -1,9 +1,101 @@
 from __future__ import annotations
 
+import json
 import sys
+from contextlib import redirect_stdout
 from pathlib import Path
 
+import _jsonfast
+import pytest
+
 ROOT = Path(__file__).resolve().parents[1]
 SRC = ROOT / "src"
 if str(SRC) not in sys.path:
     sys.path.insert(0, str(SRC))
+
+CATALOG_PATH = ROOT / "examples" / "registry" / "tools.json"
+
+
+@pytest.fixture(scope="session")
+def catalog_path() -> Path:
+    return CATALOG_PATH
+
+
+@pytest.fixture(scope="session")
+def catalog_data(catalog_path: Path) -> dict:
+    # Shared across the session: tests must treat it as read-only.
+    return json.loads(catalog_path.read_bytes())
+
+
+@pytest.fixture(scope="session")
+def tool_blobs(catalog_data: dict) -> dict[str, bytes]:
+    """Compact single-entry registry documents keyed by tool id."""
+    return {tool["id"]: _jsonfast.dumps({"tools": [tool]}) for tool in catalog_data["tools"]}
+
+
+class _Sink:
+    """Write-only stdout stand-in for output nobody inspects."""
+
+    def write(self, s: str) -> int:
+        return len(s)
+
+    def flush(self) -> None:
+        pass
+
+
+@pytest.fixture(scope="session")
+def _warm_cli(tmp_path_factory, catalog_path: Path) -> None:
+    """Pay the one-off CLI import and argparse setup before the first CLI test.
+
+    Runs against a scratch registry so the developer's real installed registry is never
+    read, then drops the parse caches it filled so tests still exercise those paths.
+    """
+    from skill_registry_rag import _resolve, cli, roles
+
+    registry = tmp_path_factory.mktemp("warm") / "installed.registry.yaml"
+    with redirect_stdout(_Sink()):
+        cli.main(["roles", "list", "--catalog", str(catalog_path), "--registry", str(registry)])
+
+    roles._DOC_CACHE.clear()
+    roles._DEP_CACHE.clear()
+    roles.friendly_role_name.cache_clear()
+    _resolve._resolve_path_cached.cache_clear()
+
+
+@pytest.fixture(scope="session")
+def installed_de_registry(tmp_path_factory, catalog_path: Path):
+    """Install the data-engineer bundle once; tests must not modify the target."""
+    from skill_registry_rag.registry import load_registry
+    from skill_registry_rag.roles import install_role_bundle
+
+    target = tmp_path_factory.mktemp("de") / "installed.registry.yaml"
+    result = install_role_bundle(
+        catalog_registry=str(catalog_path),
+        target_registry=str(target),
+        role_id="role.data-engineer",
+    )
+    return target, result, load_registry(target)
+
+
+@pytest.fixture(scope="session")
+def install_role(tmp_path_factory, catalog_path: Path):
+    """Return a factory installing a role bundle once per session, keyed by role id.
+
+    The returned registry is shared: copy it into ``tmp_path`` before mutating it.
+    """
+    from skill_registry_rag.roles import install_role_bundle
+
+    installed: dict[str, Path] = {}
+
+    def _install(role_id: str) -> Path:
+        if role_id not in installed:
+            target = tmp_path_factory.mktemp(role_id) / "installed.registry.yaml"
+            install_role_bundle(
+                catalog_registry=str(catalog_path),
+                target_registry=str(target),
+                role_id=role_id,
+            )
+            installed[role_id] = target
+        return installed[role_id]
+
+    return _install
@@ -5,7 +5,9 @@ from io import StringIO
 from pathlib import Path
 from contextlib import redirect_stdout
 
-from skill_registry_rag.cli import main
+import pytest
+
+from skill_registry_rag.cli import _default_catalog_path, main
 
 
 def test_cli_retrieve_emits_enriched_fields():
@@ -103,3 +105,26 @@ def test_cli_retrieve_security_expert():
     assert code == 0
     payload = json.loads(buf.getvalue())
     assert payload["hits"][0]["id"] == "sec.owasp-web"
+
+
+def test_default_catalog_path_prefers_env_then_registry_resolution(monkeypatch):
+    monkeypatch.setenv("SKILLMESH_CATALOG", "/tmp/custom-catalog.json")
+    assert _default_catalog_path() == "/tmp/custom-catalog.json"
+
+    monkeypatch.delenv("SKILLMESH_CATALOG")
+    monkeypatch.delenv("SKILLMESH_REGISTRY", raising=False)
+    root = Path(__file__).resolve().parents[1]
+    assert Path(_default_catalog_path()) == root / "examples" / "registry" / "tools.json"
+
+
+@pytest.mark.parametrize("use_orjson", [True, False], ids=["orjson", "stdlib"])
+def test_dumps_round_trips_non_ascii(monkeypatch, use_orjson):
+    from skill_registry_rag import cli
+
+    if use_orjson:
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(cli, "orjson", None)
+    payload = {"roles": [{"id": "role.café", "title": "Café Ops – 日本", "dependency_count": 2}]}
+
+    assert json.loads(cli._dumps(payload)) == payload
@@ -83,13 +83,8 @@ def test_install_role_payload_accepts_friendly_name(tmp_path):
     assert "role.data-analyst" in payload["added_ids"]
 
 
-def test_list_roles_payload_installed_only(tmp_path):
-    target = tmp_path / "mcp-installed-only.registry.yaml"
-    install_role_payload(
-        role="DevOps-Engineer",
-        catalog=str(_example_registry()),
-        registry=str(target),
-    )
+def test_list_roles_payload_installed_only(install_role):
+    target = install_role("role.devops-engineer")
     payload = list_roles_payload(
         catalog=str(_example_registry()),
         registry=str(target),
@@ -97,3 +92,47 @@ def test_list_roles_payload_installed_only(tmp_path):
     )
     ids = {role["id"] for role in payload["roles"]}
     assert ids == {"role.devops-engineer"}
+
+
+def test_list_roles_payload_follows_role_registry_env_changes(tmp_path, monkeypatch):
+    monkeypatch.setenv("SKILLMESH_CATALOG", str(_example_registry()))
+    first = tmp_path / "first.registry.yaml"
+    second = tmp_path / "second.registry.yaml"
+
+    monkeypatch.setenv("SKILLMESH_ROLE_REGISTRY", str(first))
+    assert list_roles_payload()["registry"] == str(first.resolve())
+
+    monkeypatch.setenv("SKILLMESH_ROLE_REGISTRY", str(second))
+    assert list_roles_payload()["registry"] == str(second.resolve())
+
+
+def test_retriever_is_reused_until_registry_changes(tmp_path):
+    from skill_registry_rag import mcp_server
+
+    instruction = tmp_path / "a.md"
+    instruction.write_text("first version", encoding="utf-8")
+    registry = tmp_path / "tools.json"
+    registry.write_text(
+        '{"tools": [{"id": "a", "title": "Alpha", "domain": "d", "instruction_file": "a.md"}]}',
+        encoding="utf-8",
+    )
+
+    first = mcp_server._get_retriever(registry, dense=False, backend="memory")
+    assert mcp_server._get_retriever(registry, dense=False, backend="memory") is first
+    assert mcp_server._get_retriever(registry, dense=False, backend="auto") is not first
+
+    instruction.write_text("second, longer version", encoding="utf-8")
+    second = mcp_server._get_retriever(registry, dense=False, backend="memory")
+    assert second is not first
+    context = build_routed_context(
+        query="alpha", registry=str(registry), top_k=1, backend="memory", provider="claude"
+    )
+    assert "second, longer version" in context
+
+    registry.write_text(
+        '{"tools": [{"id": "b", "title": "Beta", "domain": "d", "instruction_file": "a.md"}]}',
+        encoding="utf-8",
+    )
+    third = mcp_server._get_retriever(registry, dense=False, backend="memory")
+    assert third is not second
+    assert [hit.card.id for hit in third.retrieve("beta", top_k=1)] == ["b"]
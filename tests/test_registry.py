@@ -4,6 +4,7 @@ from pathlib import Path
 
 import pytest
 
+from skill_registry_rag._resolve import env_flag, resolve_path
 from skill_registry_rag.registry import RegistryError, load_registry
 
 
@@ -82,3 +83,82 @@ def test_schema_validation_rejects_invalid_registry(tmp_path):
 
     with pytest.raises(RegistryError):
         load_registry(bad, schema_path=Path(__file__).resolve().parents[1] / "examples" / "registry" / "schema.json")
+
+
+def test_resolve_path_tracks_working_directory(tmp_path, monkeypatch):
+    first = tmp_path / "a"
+    second = tmp_path / "b"
+    first.mkdir()
+    second.mkdir()
+
+    monkeypatch.chdir(first)
+    assert resolve_path("tools.json") == (first / "tools.json").resolve()
+    monkeypatch.chdir(second)
+    assert resolve_path("tools.json") == (second / "tools.json").resolve()
+
+
+@pytest.mark.parametrize(
+    "value,expected", [("1", True), (" 1 ", True), ("0", False), ("false", False), ("", False)]
+)
+def test_env_flag_requires_one(monkeypatch, value, expected):
+    monkeypatch.setenv("SKILLMESH_TEST_FLAG", value)
+    assert env_flag("SKILLMESH_TEST_FLAG") is expected
+
+
+def test_load_registry_cache_invalidates_on_instruction_edit(tmp_path, monkeypatch):
+    from skill_registry_rag import registry as registry_mod
+
+    (tmp_path / "a.md").write_text("first", encoding="utf-8")
+    registry_path = tmp_path / "tools.json"
+    registry_path.write_text(
+        '{"tools": [{"id": "a", "title": "A", "domain": "d", "instruction_file": "a.md"}]}',
+        encoding="utf-8",
+    )
+    assert load_registry(registry_path)[0].instruction_text == "first"
+
+    calls = []
+    real_read = registry_mod._read_structured
+    monkeypatch.setattr(
+        registry_mod, "_read_structured", lambda p: calls.append(p) or real_read(p)
+    )
+    load_registry(registry_path)
+    assert calls == []
+
+    (tmp_path / "a.md").write_text("second edit", encoding="utf-8")
+    assert load_registry(registry_path)[0].instruction_text == "second edit"
+    assert len(calls) == 1
+
+
+def test_load_registry_returns_caller_owned_cards():
+    registry_path = Path(__file__).resolve().parents[1] / "examples" / "registry" / "tools.json"
+    first = load_registry(registry_path)
+    first[0].tags.append("mutated-by-caller")
+    first[0].metadata["mutated"] = True
+
+    second = load_registry(registry_path)
+    assert "mutated-by-caller" not in second[0].tags
+    assert "mutated" not in second[0].metadata
+
+
+def test_load_registry_cache_is_bounded_and_can_be_disabled(tmp_path, monkeypatch):
+    from skill_registry_rag import registry as registry_mod
+
+    (tmp_path / "a.md").write_text("a", encoding="utf-8")
+    for i in range(registry_mod._CARDS_CACHE_SIZE + 3):
+        registry_path = tmp_path / f"tools-{i}.json"
+        registry_path.write_text(
+            '{"tools": [{"id": "a", "title": "A", "domain": "d", "instruction_file": "a.md"}]}',
+            encoding="utf-8",
+        )
+        load_registry(registry_path)
+    assert len(registry_mod._CARDS_CACHE) <= registry_mod._CARDS_CACHE_SIZE
+
+    monkeypatch.setenv("SKILLMESH_DISABLE_YAML_CACHE", "1")
+    calls = []
+    real_read = registry_mod._read_structured
+    monkeypatch.setattr(
+        registry_mod, "_read_structured", lambda p: calls.append(p) or real_read(p)
+    )
+    load_registry(registry_path)
+    load_registry(registry_path)
+    assert len(calls) == 2
@@ -148,3 +148,15 @@ def test_retriever_cloud_s3_query_returns_s3_expert():
 
     assert hits
     assert hits[0].card.id == "cloud.aws-s3"
+
+
+def test_retrieval_hit_payload_omits_instruction_text():
+    cards = _load_json_cards()
+    retriever = SkillRetriever(cards, use_dense=False, backend="memory")
+    hit = retriever.retrieve("opencv contour detection", top_k=1)[0]
+    payload = hit.to_payload()
+
+    assert payload["id"] == hit.card.id
+    assert payload["score"] == hit.score
+    assert "dense_score" in payload
+    assert "instruction_text" not in payload
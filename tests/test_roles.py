@@ -1,186 +1,411 @@
 from __future__ import annotations
 
-import json
-from contextlib import redirect_stdout
-from io import StringIO
+import copy
+import io
+import re
+from collections import Counter
 from pathlib import Path
 
-from skill_registry_rag.cli import main
-from skill_registry_rag.roles import install_role_bundle, list_role_offers
+import _jsonfast
+import pytest
+from skill_registry_rag import roles
+from skill_registry_rag.cli import _default_catalog_path, main
+from skill_registry_rag.roles import (
+    _clone_json_entry,
+    _parse_role_dependencies_from_instruction,
+    install_role_bundle,
+    list_role_offers,
+)
 from skill_registry_rag.registry import load_registry
 
 
-def _catalog_path() -> Path:
-    return Path(__file__).resolve().parents[1] / "examples" / "registry" / "tools.json"
+pytestmark = pytest.mark.usefixtures("_warm_cli")
 
+# Anchored at line start so only the summary line and the ROLE column can match.
+_INSTALLED_ONLY_RE = re.compile(r"^(?:Installed roles: 1|Data-Analyst)\b", re.MULTILINE)
 
-def test_list_role_offers_includes_roles_and_dependency_counts():
-    offers = list_role_offers(catalog_registry=str(_catalog_path()))
+
+@pytest.mark.parametrize(
+    "role_id,min_deps",
+    [
+        ("role.data-engineer", 8),
+        # Empty dependency list in tools.json; falls back to role markdown.
+        ("role.devops-engineer", 8),
+    ],
+)
+def test_list_role_offers_includes_roles_and_dependency_counts(role_id, min_deps, catalog_path):
+    offers = list_role_offers(catalog_registry=str(catalog_path))
     by_id = {offer["id"]: offer for offer in offers}
 
-    assert "role.data-engineer" in by_id
-    assert by_id["role.data-engineer"]["dependency_count"] >= 8
+    assert role_id in by_id
+    assert by_id[role_id]["dependency_count"] >= min_deps
 
-    # This role has empty dependency list in tools.json and should fall back to role markdown.
-    assert "role.devops-engineer" in by_id
-    assert by_id["role.devops-engineer"]["dependency_count"] >= 8
 
-
-def test_install_role_bundle_creates_registry_with_role_and_dependencies(tmp_path):
-    target = tmp_path / "installed.registry.yaml"
-    result = install_role_bundle(
-        catalog_registry=str(_catalog_path()),
-        target_registry=str(target),
-        role_id="role.data-engineer",
-    )
+def test_install_role_bundle_creates_registry_with_role_and_dependencies(installed_de_registry):
+    target, result, cards = installed_de_registry
 
     assert target.exists()
     assert "role.data-engineer" in result["added_ids"]
-    cards = load_registry(target)
     ids = {card.id for card in cards}
     assert "role.data-engineer" in ids
     assert "data.spark" in ids
     assert "cloud.terraform" in ids
 
 
-def test_install_role_bundle_skips_existing_cards(tmp_path):
-    catalog = json.loads(_catalog_path().read_text(encoding="utf-8"))
-    tools = catalog["tools"]
-    spark = [entry for entry in tools if entry.get("id") == "data.spark"][0]
+def test_install_role_bundle_skips_existing_cards(tmp_path, tool_blobs, catalog_path):
     target = tmp_path / "existing.registry.json"
-    target.write_text(json.dumps({"tools": [spark]}, indent=2), encoding="utf-8")
+    target.write_bytes(tool_blobs["data.spark"])
 
     result = install_role_bundle(
-        catalog_registry=str(_catalog_path()),
+        catalog_registry=str(catalog_path),
         target_registry=str(target),
         role_id="role.data-engineer",
     )
 
     assert "data.spark" in result["already_present_ids"]
-    reloaded = json.loads(target.read_text(encoding="utf-8"))
-    ids = [entry["id"] for entry in reloaded["tools"]]
-    assert ids.count("data.spark") == 1
+    reloaded = _jsonfast.loads(target.read_bytes())
+    counts = Counter(entry["id"] for entry in reloaded["tools"])
+    assert counts["data.spark"] == 1
 
 
-def test_cli_roles_list_and_install_json(tmp_path):
-    buf = StringIO()
-    with redirect_stdout(buf):
-        code = main(["roles", "list", "--catalog", str(_catalog_path()), "--json"])
+def test_cli_roles_list_and_install_json(tmp_path, capsys, catalog_path):
+    code = main(["roles", "list", "--catalog", str(catalog_path), "--json"])
     assert code == 0
-    payload = json.loads(buf.getvalue())
+    payload = _jsonfast.loads(capsys.readouterr().out)
     assert payload["roles"]
 
     target = tmp_path / "roles.registry.json"
-    buf = StringIO()
-    with redirect_stdout(buf):
-        code = main(
-            [
-                "roles",
-                "install",
-                "--catalog",
-                str(_catalog_path()),
-                "--registry",
-                str(target),
-                "--role-id",
-                "role.devops-engineer",
-                "--json",
-            ]
-        )
+    code = main(
+        [
+            "roles",
+            "install",
+            "--catalog",
+            str(catalog_path),
+            "--registry",
+            str(target),
+            "--role-id",
+            "role.devops-engineer",
+            "--json",
+        ]
+    )
 
     assert code == 0
-    install_payload = json.loads(buf.getvalue())
+    install_payload = _jsonfast.loads(capsys.readouterr().out)
     assert "role.devops-engineer" in install_payload["added_ids"]
     # Dependency parsing falls back to role markdown when dependencies are absent.
     assert "devops.nginx" in install_payload["added_ids"]
 
 
-def test_cli_roles_list_uses_default_catalog():
-    buf = StringIO()
-    with redirect_stdout(buf):
-        code = main(["roles", "list", "--json"])
-    assert code == 0
-    payload = json.loads(buf.getvalue())
-    assert payload["roles"]
-
-
-def test_cli_roles_wizard_interactive_install(tmp_path, monkeypatch):
+def test_cli_roles_wizard_interactive_install(tmp_path, monkeypatch, capsys, catalog_path):
     target = tmp_path / "wizard.registry.yaml"
-    answers = iter(["1", "y"])
-    monkeypatch.setattr("builtins.input", lambda _prompt="": next(answers))
-
-    buf = StringIO()
-    with redirect_stdout(buf):
-        code = main(
-            [
-                "roles",
-                "wizard",
-                "--catalog",
-                str(_catalog_path()),
-                "--registry",
-                str(target),
-            ]
-        )
+    monkeypatch.setattr("sys.stdin", io.StringIO("1\ny\n"))
+
+    code = main(
+        [
+            "roles",
+            "wizard",
+            "--catalog",
+            str(catalog_path),
+            "--registry",
+            str(target),
+        ]
+    )
 
     assert code == 0
     assert target.exists()
-    output = buf.getvalue()
+    output = capsys.readouterr().out
     assert "SkillMesh Role Wizard" in output
     assert "Installed role bundle:" in output
 
 
-def test_cli_roles_list_uses_friendly_role_display():
-    buf = StringIO()
-    with redirect_stdout(buf):
-        code = main(["roles", "list", "--catalog", str(_catalog_path())])
+def test_list_role_offers_uses_default_catalog():
+    offers = list_role_offers(catalog_registry=_default_catalog_path())
+    assert offers
+
+
+def test_cli_roles_list_uses_friendly_role_display(capsys, catalog_path):
+    code = main(["roles", "list", "--catalog", str(catalog_path)])
     assert code == 0
-    output = buf.getvalue()
+    output = capsys.readouterr().out
     assert "Machine-Learning-Researcher" in output
     assert "role.ml-researcher" not in output
 
 
-def test_cli_roles_no_subcommand_shows_installed_only(tmp_path):
-    target = tmp_path / "installed-only.registry.yaml"
-    install_role_bundle(
-        catalog_registry=str(_catalog_path()),
-        target_registry=str(target),
-        role_id="role.data-analyst",
-    )
+def test_cli_roles_no_subcommand_shows_installed_only(install_role, capsys, catalog_path):
+    target = install_role("role.data-analyst")
 
-    buf = StringIO()
-    with redirect_stdout(buf):
-        code = main(
-            [
-                "roles",
-                "--catalog",
-                str(_catalog_path()),
-                "--registry",
-                str(target),
-            ]
-        )
+    code = main(
+        [
+            "roles",
+            "--catalog",
+            str(catalog_path),
+            "--registry",
+            str(target),
+        ]
+    )
     assert code == 0
-    output = buf.getvalue()
-    assert "Installed roles: 1" in output
-    assert "Data-Analyst" in output
-    assert "Machine-Learning-Researcher" not in output
+    out = capsys.readouterr().out
+    found = {m.group() for m in _INSTALLED_ONLY_RE.finditer(out)}
+    assert {"Installed roles: 1", "Data-Analyst"} <= found
+    assert "Machine-Learning-Researcher" not in out
 
 
-def test_cli_friendly_shorthand_install_command(tmp_path):
+def test_cli_friendly_shorthand_install_command(tmp_path, capsys, catalog_path):
     target = tmp_path / "shorthand.registry.yaml"
-    buf = StringIO()
-    with redirect_stdout(buf):
-        code = main(
-            [
-                "Data-Analyst",
-                "install",
-                "--catalog",
-                str(_catalog_path()),
-                "--registry",
-                str(target),
-            ]
-        )
+    code = main(
+        [
+            "Data-Analyst",
+            "install",
+            "--catalog",
+            str(catalog_path),
+            "--registry",
+            str(target),
+        ]
+    )
     assert code == 0
-    output = buf.getvalue()
+    output = capsys.readouterr().out
     assert "Installed role bundle: Data-Analyst" in output
     cards = load_registry(target)
     ids = {card.id for card in cards}
     assert "role.data-analyst" in ids
+
+
+def test_list_role_offers_sees_registry_changes_after_install(tmp_path, catalog_path):
+    target = tmp_path / "refresh.registry.yaml"
+    target.write_text("tools: []\n", encoding="utf-8")
+
+    before = list_role_offers(catalog_registry=str(catalog_path), installed_registry=str(target))
+    assert not any(offer["installed"] for offer in before)
+
+    install_role_bundle(
+        catalog_registry=str(catalog_path),
+        target_registry=str(target),
+        role_id="role.data-analyst",
+    )
+
+    after = list_role_offers(catalog_registry=str(catalog_path), installed_registry=str(target))
+    installed = [offer["id"] for offer in after if offer["installed"]]
+    assert installed == ["role.data-analyst"]
+
+
+def test_parse_role_dependencies_reads_only_allowed_section(tmp_path):
+    instruction = tmp_path / "role.md"
+    instruction.write_text(
+        "# Role\n"
+        "Uses `not.a-dep` in the intro.\n"
+        "\n"
+        "## Allowed Expert Dependencies\n"
+        "- `data.spark`\n"
+        "- `data.dbt` and `data.spark`\n"
+        "\n"
+        "## Workflow\n"
+        "- `ignored.dep`\n",
+        encoding="utf-8",
+    )
+
+    assert _parse_role_dependencies_from_instruction(instruction) == ["data.spark", "data.dbt"]
+
+
+def test_clone_json_entry_matches_deepcopy():
+    entry = {
+        "id": "data.spark",
+        "tags": ["spark", "etl"],
+        "input_contract": {"required": "dataset", "optional": "schema"},
+        "metadata": {"owners": [{"name": "data", "weight": 1.5}], "active": True, "ttl": None},
+    }
+
+    clone = _clone_json_entry(entry)
+
+    assert clone == copy.deepcopy(entry)
+    clone["tags"].append("mutated")
+    clone["metadata"]["owners"][0]["name"] = "changed"
+    assert entry["tags"] == ["spark", "etl"]
+    assert entry["metadata"]["owners"][0]["name"] == "data"
+
+
+def test_install_role_bundle_reinstall_does_not_rewrite_registry(tmp_path, catalog_path):
+    target = tmp_path / "reinstall.registry.yaml"
+    install_role_bundle(
+        catalog_registry=str(catalog_path),
+        target_registry=str(target),
+        role_id="role.data-analyst",
+    )
+    before = target.stat().st_mtime_ns
+
+    result = install_role_bundle(
+        catalog_registry=str(catalog_path),
+        target_registry=str(target),
+        role_id="role.data-analyst",
+    )
+
+    assert result["added_ids"] == []
+    assert "role.data-analyst" in result["already_present_ids"]
+    assert target.stat().st_mtime_ns == before
+
+
+def test_compiled_cache_round_trips_yaml_registry(tmp_path, monkeypatch, catalog_path):
+    monkeypatch.setenv("SKILLMESH_COMPILED_CACHE", "1")
+    monkeypatch.setenv("SKILLMESH_DISABLE_YAML_CACHE", "")
+    target = tmp_path / "compiled.registry.yaml"
+    install_role_bundle(
+        catalog_registry=str(catalog_path),
+        target_registry=str(target),
+        role_id="role.data-analyst",
+    )
+
+    first = list_role_offers(catalog_registry=str(catalog_path), installed_registry=str(target))
+    assert list(tmp_path.glob("compiled.registry.yaml.*.pkl"))
+
+    roles._DOC_CACHE.clear()
+    parsed: list[Path] = []
+    parse = roles._parse_registry_document
+    monkeypatch.setattr(roles, "_parse_registry_document", lambda path: parsed.append(path) or parse(path))
+    second = list_role_offers(catalog_registry=str(catalog_path), installed_registry=str(target))
+    assert first == second
+    assert target not in parsed
+
+
+def test_normalize_entries_returns_caller_owned_outer_dict():
+    payload = {"version": 1, "tools": [{"id": "a"}]}
+    normalized, key = roles._normalize_entries(payload, path=Path("x.json"))
+    normalized[key] = []
+
+    assert payload == {"version": 1, "tools": [{"id": "a"}]}
+
+    empty: dict = {}
+    normalized, key = roles._normalize_entries(empty, path=Path("x.json"))
+    assert normalized == {"tools": []} and key == "tools"
+    assert empty == {}
+
+
+def test_large_json_catalog_is_parsed_through_mmap(tmp_path, monkeypatch, catalog_data):
+    pytest.importorskip("orjson")
+    mapped = []
+    real_mmap = roles.mmap.mmap
+
+    def recording_mmap(*args, **kwargs):
+        mapped.append(args)
+        return real_mmap(*args, **kwargs)
+
+    monkeypatch.setattr(roles.mmap, "mmap", recording_mmap)
+    monkeypatch.setattr(roles, "_MMAP_MIN_BYTES", 0)
+    catalog = tmp_path / "tools.json"
+    catalog.write_bytes(_jsonfast.dumps(catalog_data))
+
+    assert roles._parse_registry_document(catalog) == catalog_data
+    assert len(mapped) == 1
+
+    monkeypatch.setattr(roles, "_MMAP_MIN_BYTES", catalog.stat().st_size + 1)
+    assert roles._parse_registry_document(catalog) == catalog_data
+    assert len(mapped) == 1
+
+
+def test_atomic_write_preserves_registry_mode(tmp_path):
+    target = tmp_path / "private.registry.yaml"
+    target.write_text("tools: []\n", encoding="utf-8")
+    target.chmod(0o600)
+
+    roles._write_registry_document(target, {"tools": []})
+
+    assert target.stat().st_mode & 0o777 == 0o600
+    assert not list(tmp_path.glob("*.tmp"))
+
+
+def test_atomic_write_is_safe_across_threads(tmp_path):
+    from concurrent.futures import ThreadPoolExecutor
+
+    target = tmp_path / "concurrent.registry.json"
+    payloads = [{"tools": [{"id": f"t{i}"}] * 50} for i in range(8)]
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(lambda payload: roles._write_registry_document(target, payload), payloads))
+
+    assert _jsonfast.loads(target.read_bytes()) in payloads
+    assert not list(tmp_path.glob("*.tmp"))
+
+
+def test_compiled_cache_reparses_corrupt_pickle(tmp_path, monkeypatch):
+    monkeypatch.setenv("SKILLMESH_COMPILED_CACHE", "1")
+    target = tmp_path / "corrupt.registry.yaml"
+    target.write_text("tools: []\n", encoding="utf-8")
+    sig = roles.file_signature(target)
+    target.with_name(f"{target.name}.{sig[0]}-{sig[1]}.pkl").write_bytes(b"not a pickle")
+
+    assert roles._load_compiled_document(target, sig) == {"tools": []}
+
+
+def test_prefetched_role_dependencies_match_serial_parse(tmp_path, monkeypatch):
+    tools = [
+        {"id": f"tool.t{i}", "title": f"T{i}", "domain": "d", "instruction_file": "t.md"}
+        for i in range(4)
+    ]
+    fallback_roles = []
+    for i in range(roles._PREFETCH_MIN_FILES + 1):
+        (tmp_path / f"r{i}.md").write_text(
+            f"# Role {i}\n\n## Allowed expert dependencies\n- `tool.t{i % 4}`\n- `tool.t3`\n",
+            encoding="utf-8",
+        )
+        fallback_roles.append(
+            {"id": f"role.r{i}", "title": f"R{i}", "domain": "role", "instruction_file": f"r{i}.md"}
+        )
+    catalog = tmp_path / "catalog.json"
+    catalog.write_bytes(_jsonfast.dumps({"tools": tools + fallback_roles}))
+
+    pool_sizes = []
+    real_pool = roles.ThreadPoolExecutor
+
+    def recording_pool(*args, **kwargs):
+        pool_sizes.append(kwargs.get("max_workers"))
+        return real_pool(*args, **kwargs)
+
+    monkeypatch.setattr(roles, "ThreadPoolExecutor", recording_pool)
+    roles._DEP_CACHE.clear()
+    prefetched = list_role_offers(catalog_registry=str(catalog))
+    assert pool_sizes
+
+    monkeypatch.setattr(roles, "_prefetch_role_dependencies", lambda *a, **k: None)
+    roles._DEP_CACHE.clear()
+    serial = list_role_offers(catalog_registry=str(catalog))
+
+    assert prefetched == serial
+    assert [offer["dependency_ids"] for offer in serial][:2] == [
+        ["tool.t0", "tool.t3"],
+        ["tool.t1", "tool.t3"],
+    ]
+
+
+@pytest.mark.parametrize("use_orjson", [True, False], ids=["orjson", "stdlib"])
+@pytest.mark.parametrize("suffix", [".json", ".yaml"])
+def test_written_registry_round_trips_non_ascii(tmp_path, monkeypatch, use_orjson, suffix):
+    if use_orjson:
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(roles, "orjson", None)
+    payload = {"tools": [{"id": "role.café", "title": "Café Ops – Größe 日本", "tags": ["ü"]}]}
+    target = tmp_path / f"unicode.registry{suffix}"
+
+    roles._write_registry_document(target, payload)
+
+    assert target.read_bytes().endswith(b"\n")
+    assert roles._parse_registry_document(target) == payload
+
+
+def test_registry_document_cache_is_bounded(tmp_path):
+    for i in range(roles._DOC_CACHE_SIZE + 3):
+        target = tmp_path / f"bounded-{i}.registry.json"
+        target.write_bytes(b'{"tools": []}')
+        roles._read_registry_document(target)
+
+    assert len(roles._DOC_CACHE) == roles._DOC_CACHE_SIZE
+    assert target in roles._DOC_CACHE
+    assert tmp_path / "bounded-0.registry.json" not in roles._DOC_CACHE
+
+
+def test_role_dependency_cache_is_bounded(tmp_path, monkeypatch):
+    monkeypatch.setattr(roles, "_DEP_CACHE_SIZE", 3)
+    roles._DEP_CACHE.clear()
+    for i in range(5):
+        instruction = tmp_path / f"role-{i}.md"
+        instruction.write_text("## Allowed expert dependencies\n- `tool.a`\n", encoding="utf-8")
+        assert _parse_role_dependencies_from_instruction(instruction) == ["tool.a"]
+
+    assert list(roles._DEP_CACHE) == [tmp_path / f"role-{i}.md" for i in (2, 3, 4)]